@@ -1,32 +1,17 @@
 """MF PipoNodes — Node package. Merges all sub-module registrations."""
 
-from .random import NODE_CLASS_MAPPINGS as _random_cls, NODE_DISPLAY_NAME_MAPPINGS as _random_disp
-from .text import NODE_CLASS_MAPPINGS as _text_cls, NODE_DISPLAY_NAME_MAPPINGS as _text_disp
-from .logging import NODE_CLASS_MAPPINGS as _log_cls, NODE_DISPLAY_NAME_MAPPINGS as _log_disp
-from .math import NODE_CLASS_MAPPINGS as _math_cls, NODE_DISPLAY_NAME_MAPPINGS as _math_disp
-from .sequencing import NODE_CLASS_MAPPINGS as _seq_cls, NODE_DISPLAY_NAME_MAPPINGS as _seq_disp
-from .visualization import NODE_CLASS_MAPPINGS as _viz_cls, NODE_DISPLAY_NAME_MAPPINGS as _viz_disp
-from .data import NODE_CLASS_MAPPINGS as _data_cls, NODE_DISPLAY_NAME_MAPPINGS as _data_disp
+import importlib
 
-NODE_CLASS_MAPPINGS = {
-    **_random_cls,
-    **_text_cls,
-    **_log_cls,
-    **_math_cls,
-    **_seq_cls,
-    **_viz_cls,
-    **_data_cls,
-}
+_SUBMODULES = ("random", "text", "logging", "math", "sequencing", "visualization", "data")
 
-NODE_DISPLAY_NAME_MAPPINGS = {
-    **_random_disp,
-    **_text_disp,
-    **_log_disp,
-    **_math_disp,
-    **_seq_disp,
-    **_viz_disp,
-    **_data_disp,
-}
+NODE_CLASS_MAPPINGS = {}
+NODE_DISPLAY_NAME_MAPPINGS = {}
+
+for _name in _SUBMODULES:
+    _mod = importlib.import_module(f".{_name}", __name__)
+    # update() merges in place instead of copying keys through intermediate dicts
+    NODE_CLASS_MAPPINGS.update(_mod.NODE_CLASS_MAPPINGS)
+    NODE_DISPLAY_NAME_MAPPINGS.update(_mod.NODE_DISPLAY_NAME_MAPPINGS)
 
 # Re-export stateful classes so server/routes.py can import them
 from .sequencing import MF_StoryDriver
@@ -0,0 +1,34 @@
+"""MF PipoNodes — Helpers shared across node modules."""
+
+import os
+import re
+
+# Per-execution console logging is opt-in: set MF_PIPO_DEBUG=1. Prints on the
+# hot node paths take the stdout lock every tick otherwise.
+DEBUG = os.environ.get("MF_PIPO_DEBUG") == "1"
+
+# Directories already created this session; lets repeated writes to the same
+# location skip the makedirs stat syscall
+_DIRS_ENSURED = set()
+
+
+def ensure_dir(path):
+    """os.makedirs(exist_ok=True) that only hits the filesystem once per path."""
+    if path not in _DIRS_ENSURED:
+        os.makedirs(path, exist_ok=True)
+        _DIRS_ENSURED.add(path)
+
+
+# Matches a payload wrapped in a single markdown code fence (```json ... ```)
+_FENCE_RE = re.compile(r"\A```[^\n]*\n(.*?)\n?```\s*\Z", re.DOTALL)
+
+
+def strip_markdown_fences(data):
+    """Remove a surrounding markdown code fence from a string, if present."""
+    if not isinstance(data, str):
+        return data
+    data = data.strip()
+    if not data.startswith("```"):
+        return data
+    match = _FENCE_RE.match(data)
+    return match.group(1) if match else data
@@ -2,15 +2,88 @@
 
 import os
 import json
-import csv
-import xml.etree.ElementTree as ET
 
+from ._common import ensure_dir as _ensure_dir, strip_markdown_fences
+
+# Optional C-accelerated JSON (several times faster than stdlib json).
 try:
-    import yaml
-    HAS_YAML = True
+    import orjson
 except ImportError:
-    HAS_YAML = False
-    print("[MF_PipoNodes] Warning: pyyaml not installed. YAML format disabled in Save/Read Data.")
+    orjson = None
+
+_json_loads = orjson.loads if orjson else json.loads
+
+
+def _json_dumps_indented(obj):
+    """Serialize to pretty-printed JSON bytes, using orjson when available."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+# The heavier format backends (yaml, xml/lxml, pyarrow) are imported on first
+# use so loading the node pack does not pay for formats a workflow never
+# touches. Each helper probes once and memoizes; sys.modules caching makes
+# later imports inside methods a dict lookup. None = not probed, False = missing.
+_yaml_backend = None
+_xml_backend = None
+_pacsv = None
+
+# Below this size the stdlib csv module wins on fixed overhead
+_PYARROW_CSV_MIN_BYTES = 64 * 1024
+
+
+def _get_yaml():
+    """Import pyyaml on first use. Returns (yaml, Loader, Dumper) or None."""
+    global _yaml_backend
+    if _yaml_backend is None:
+        try:
+            import yaml
+            # Prefer the libyaml-backed C loader/dumper (5-15x faster than pure Python)
+            try:
+                from yaml import CSafeLoader as loader, CSafeDumper as dumper
+            except ImportError:
+                from yaml import SafeLoader as loader, SafeDumper as dumper
+                print("[MF_PipoNodes] Note: libyaml not available, using pure-Python YAML loader.")
+            _yaml_backend = (yaml, loader, dumper)
+        except ImportError:
+            _yaml_backend = False
+            print("[MF_PipoNodes] Warning: pyyaml not installed. YAML format disabled in Save/Read Data.")
+    return _yaml_backend or None
+
+
+def _get_xml():
+    """Import the XML backend on first use. Returns (etree, is_lxml).
+
+    Prefers lxml — libxml2-backed, faster than ElementTree, and its native
+    pretty-print avoids the O(n) indent walk before every write.
+    """
+    global _xml_backend
+    if _xml_backend is None:
+        try:
+            from lxml import etree
+            _xml_backend = (etree, True)
+        except ImportError:
+            import xml.etree.ElementTree as etree
+            _xml_backend = (etree, False)
+    return _xml_backend
+
+
+def _get_pyarrow_csv():
+    """Import the optional multithreaded C++ CSV parser. Returns module or None."""
+    global _pacsv
+    if _pacsv is None:
+        try:
+            import pyarrow.csv as pacsv
+            _pacsv = pacsv
+        except ImportError:
+            _pacsv = False
+    return _pacsv or None
+
+
+def _looks_like_csv_header(row):
+    """True if every cell in the row looks like a non-numeric identifier."""
+    return all(c and not c.replace(".", "", 1).lstrip("-").isdigit() for c in row)
 
 
 class MF_SaveData:
@@ -20,22 +93,6 @@ class MF_SaveData:
 
     DESCRIPTION = "Saves string data to file.\nSupports JSON, CSV, XML, and YAML formats."
 
-    @staticmethod
-    def _clean_markdown_fences(data):
-        """Remove markdown code fences if present"""
-        if isinstance(data, str):
-            data = data.strip()
-            # Remove opening code fence (```json, ```xml, etc.)
-            if data.startswith("```"):
-                lines = data.split("\n")
-                if lines[0].startswith("```"):
-                    lines = lines[1:]  # Remove first line
-                # Remove closing code fence
-                if lines and lines[-1].strip() == "```":
-                    lines = lines[:-1]  # Remove last line
-                data = "\n".join(lines)
-        return data
-
     @classmethod
     def INPUT_TYPES(cls):
         return {
@@ -56,10 +113,10 @@ class MF_SaveData:
     def save_data(self, data, output_path, filename, format):
         try:
             # Clean data - remove markdown code fences if present
-            data = self._clean_markdown_fences(data)
+            data = strip_markdown_fences(data)
 
             # Create output directory if it doesn't exist
-            os.makedirs(output_path, exist_ok=True)
+            _ensure_dir(output_path)
 
             # Build full filepath
             filepath = os.path.join(output_path, f"{filename}.{format}")
@@ -83,45 +140,69 @@ class MF_SaveData:
 
     def _save_json(self, data, filepath):
         """Save as JSON"""
+        # Fast path: upstream nodes often hand over already-indented JSON
+        # (e.g. from MF_ReadData); write it verbatim instead of paying a
+        # full parse + re-serialize just to pretty-print it again
+        stripped = data.lstrip()
+        if stripped.startswith(("{\n  ", "[\n  ")) and stripped.rstrip().endswith(("}", "]")):
+            with open(filepath, "wb") as f:
+                f.write(data.encode("utf-8"))
+            return
+
         try:
             # Try to parse if it's already JSON
-            parsed = json.loads(data)
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(parsed, f, indent=2, ensure_ascii=False)
-        except json.JSONDecodeError:
+            parsed = _json_loads(data)
+            with open(filepath, "wb") as f:
+                f.write(_json_dumps_indented(parsed))
+        except ValueError:
             # If not valid JSON, just write the string as-is
             with open(filepath, "w", encoding="utf-8") as f:
                 f.write(data)
 
     def _save_xml(self, data, filepath):
         """Save as XML"""
+        etree, is_lxml = _get_xml()
+        if is_lxml:
+            try:
+                # Try to parse if it's already XML
+                root = etree.fromstring(data.encode("utf-8"))
+            except etree.XMLSyntaxError:
+                # If not valid XML, create a simple structure
+                root = etree.Element("data")
+                root.text = data
+            tree = etree.ElementTree(root)
+            tree.write(filepath, pretty_print=True, encoding="utf-8", xml_declaration=True)
+            return
+
         try:
             # Try to parse if it's already XML
-            root = ET.fromstring(data)
-            tree = ET.ElementTree(root)
-            ET.indent(tree, space="  ")
-            tree.write(filepath, encoding="utf-8", xml_declaration=True)
-        except ET.ParseError:
+            root = etree.fromstring(data)
+        except etree.ParseError:
             # If not valid XML, create a simple structure
-            root = ET.Element("data")
+            root = etree.Element("data")
             root.text = data
-            tree = ET.ElementTree(root)
-            ET.indent(tree, space="  ")
-            tree.write(filepath, encoding="utf-8", xml_declaration=True)
+        tree = etree.ElementTree(root)
+        etree.indent(tree, space="  ")
+        tree.write(filepath, encoding="utf-8", xml_declaration=True)
 
     def _save_csv(self, data, filepath):
         """Save as CSV"""
+        import csv
+
         with open(filepath, "w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
             # Try to parse as JSON array first
             try:
-                parsed = json.loads(data)
+                parsed = _json_loads(data)
                 if isinstance(parsed, list):
                     # If it's a list of dicts, write as proper CSV
                     if parsed and isinstance(parsed[0], dict):
-                        writer.writerow(parsed[0].keys())
-                        for row in parsed:
-                            writer.writerow(row.values())
+                        dict_writer = csv.DictWriter(
+                            f, fieldnames=list(parsed[0].keys()), extrasaction="ignore"
+                        )
+                        dict_writer.writeheader()
+                        # writerows streams the whole list in one C-level pass
+                        dict_writer.writerows(parsed)
                     else:
                         # List of values
                         for item in parsed:
@@ -135,14 +216,34 @@ class MF_SaveData:
 
     def _save_yaml(self, data, filepath):
         """Save as YAML"""
-        if not HAS_YAML:
+        yaml_backend = _get_yaml()
+        if yaml_backend is None:
             raise RuntimeError("pyyaml is not installed. Run: pip install pyyaml")
+        yaml, _, yaml_dumper = yaml_backend
+
+        # Cheap probe: JSON payloads start with {, [ or a quote. Anything else
+        # is already YAML-compatible text — write it verbatim instead of
+        # paying a parse that is guaranteed to fail (or a needless re-dump)
+        stripped = data.lstrip()
+        if not stripped.startswith(("{", "[", '"')):
+            with open(filepath, "w", encoding="utf-8") as f:
+                f.write(data)
+            return
+
         try:
-            # Try to parse as JSON first
-            parsed = json.loads(data)
+            # Parse as JSON and re-emit as YAML. The large width disables the
+            # dumper's Python-level line wrapping on long string values.
+            parsed = _json_loads(data)
             with open(filepath, "w", encoding="utf-8") as f:
-                yaml.dump(parsed, f, default_flow_style=False, allow_unicode=True)
-        except json.JSONDecodeError:
+                yaml.dump(
+                    parsed,
+                    f,
+                    Dumper=yaml_dumper,
+                    default_flow_style=False,
+                    allow_unicode=True,
+                    width=2**20,
+                )
+        except ValueError:
             # Save as simple string
             with open(filepath, "w", encoding="utf-8") as f:
                 f.write(data)
@@ -207,36 +308,78 @@ class MF_ReadData:
 
     def _read_json(self, filepath):
         """Read JSON and return as formatted string"""
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return json.dumps(data, indent=2, ensure_ascii=False)
+        with open(filepath, "rb") as f:
+            data = _json_loads(f.read())
+        return _json_dumps_indented(data).decode("utf-8")
 
     def _read_xml(self, filepath):
         """Read XML and return as string"""
-        tree = ET.parse(filepath)
+        etree, is_lxml = _get_xml()
+        # Serialize to UTF-8 bytes and decode once: the bytes writer is a
+        # tighter C path than the 'unicode' one, which builds the string
+        # incrementally inside the serializer
+        if is_lxml:
+            tree = etree.parse(filepath)
+            return etree.tostring(
+                tree.getroot(), pretty_print=True, encoding="utf-8", xml_declaration=False
+            ).decode("utf-8")
+
+        tree = etree.parse(filepath)
         root = tree.getroot()
-        ET.indent(root, space="  ")
-        return ET.tostring(root, encoding="unicode")
+        etree.indent(root, space="  ")
+        return etree.tostring(root, encoding="utf-8", xml_declaration=False).decode("utf-8")
 
     def _read_csv(self, filepath):
         """Read CSV and return as JSON string"""
-        with open(filepath, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            data = list(reader)
-            # If no headers detected, read as simple list
-            if not data:
-                f.seek(0)
-                reader = csv.reader(f)
-                data = [row for row in reader]
-            return json.dumps(data, indent=2, ensure_ascii=False)
+        if os.path.getsize(filepath) > _PYARROW_CSV_MIN_BYTES:
+            pacsv = _get_pyarrow_csv()
+            if pacsv is not None:
+                table = pacsv.read_csv(
+                    filepath, read_options=pacsv.ReadOptions(use_threads=True)
+                )
+                # pyarrow always consumes the first row as the header. Apply
+                # the same heuristic as the stdlib branch below so a
+                # headerless CSV keeps the same output shape regardless of
+                # size: re-read with generated names and return plain rows.
+                if not _looks_like_csv_header(table.column_names):
+                    table = pacsv.read_csv(
+                        filepath,
+                        read_options=pacsv.ReadOptions(
+                            use_threads=True, autogenerate_column_names=True
+                        ),
+                    )
+                    columns = [col.to_pylist() for col in table.columns]
+                    rows = [list(row) for row in zip(*columns)]
+                    return _json_dumps_indented(rows).decode("utf-8")
+                return _json_dumps_indented(table.to_pylist()).decode("utf-8")
+
+        import csv
+
+        with open(filepath, "r", encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+
+        if not rows:
+            return "[]"
+
+        # Treat the first row as a header only if every cell looks like a
+        # non-numeric identifier; otherwise return plain rows. One pass,
+        # no rewind-and-reparse.
+        header = rows[0]
+        if _looks_like_csv_header(header):
+            data = [dict(zip(header, row)) for row in rows[1:]]
+        else:
+            data = rows
+        return _json_dumps_indented(data).decode("utf-8")
 
     def _read_yaml(self, filepath):
         """Read YAML and return as JSON string"""
-        if not HAS_YAML:
+        yaml_backend = _get_yaml()
+        if yaml_backend is None:
             raise RuntimeError("pyyaml is not installed. Run: pip install pyyaml")
+        yaml, yaml_loader, _ = yaml_backend
         with open(filepath, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-            return json.dumps(data, indent=2, ensure_ascii=False)
+            data = yaml.load(f, Loader=yaml_loader)
+            return _json_dumps_indented(data).decode("utf-8")
 
 
 class MF_ShowData:
@@ -263,26 +406,10 @@ class MF_ShowData:
     CATEGORY = "MF_PipoNodes/Data"
     OUTPUT_NODE = True
 
-    @staticmethod
-    def _clean_data(data):
-        """Remove markdown code fences if present"""
-        if isinstance(data, str):
-            data = data.strip()
-            # Remove opening code fence (```json, ```python, etc.)
-            if data.startswith("```"):
-                lines = data.split("\n")
-                if lines[0].startswith("```"):
-                    lines = lines[1:]  # Remove first line
-                # Remove closing code fence
-                if lines and lines[-1].strip() == "```":
-                    lines = lines[:-1]  # Remove last line
-                data = "\n".join(lines)
-        return data
-
     def show_data(self, data, unique_id=None):
         """Display the data in a text widget and pass it through"""
         # Clean the data (remove markdown code fences if present)
-        cleaned_data = self._clean_data(data)
+        cleaned_data = strip_markdown_fences(data)
 
         # Print to console
         print("=" * 50)
@@ -307,6 +434,11 @@ class MF_CustomDropdownMenu:
 
     CATEGORY = "MF_PipoNodes/Utilities"
 
+    # Default options, split once at class-definition time so INPUT_TYPES and
+    # any future selection validation never re-split the string
+    _DEFAULT_OPTIONS_STR = "low\nmedium\nhigh\nultra"
+    _DEFAULT_OPTIONS = tuple(_DEFAULT_OPTIONS_STR.split("\n"))
+
     @classmethod
     def INPUT_TYPES(cls):
         return {
@@ -320,7 +452,7 @@ class MF_CustomDropdownMenu:
                 "dropdown_options": (
                     "STRING",
                     {
-                        "default": "low\nmedium\nhigh\nultra",
+                        "default": cls._DEFAULT_OPTIONS_STR,
                         "multiline": False,
                     },
                 ),
@@ -331,7 +463,7 @@ class MF_CustomDropdownMenu:
     RETURN_NAMES = ("selected_value",)
     FUNCTION = "execute"
 
-    def execute(self, selection, dropdown_options="low\nmedium\nhigh\nultra"):
+    def execute(self, selection, dropdown_options=_DEFAULT_OPTIONS_STR):
         """
         Returns the selected dropdown value as a string.
 
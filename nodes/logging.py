@@ -1,9 +1,12 @@
 """MF PipoNodes — Logging nodes."""
 
 import os
+import atexit
 import datetime
 import folder_paths
 
+from ._common import ensure_dir as _ensure_dir
+
 
 def _get_log_file_path(save_log_path, log_file_name, output_dir):
     """Helper to normalize log file path and name."""
@@ -19,11 +22,39 @@ def _get_log_file_path(save_log_path, log_file_name, output_dir):
     return os.path.join(save_log_path, log_file_name)
 
 
+# Cap on the cached log content kept for display (tail of the file)
+_LOG_CACHE_MAX_CHARS = 256 * 1024
+
+# Open file descriptors per log path, shared across node instances. ComfyUI
+# re-creates node objects as workflows change; a per-instance table (with a
+# per-instance atexit hook) would pin every replaced instance and leave its
+# descriptor to the same file open until process exit.
+_log_fds = {}
+
+
+def _close_log_fds():
+    for fd in _log_fds.values():
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+    _log_fds.clear()
+
+
+atexit.register(_close_log_fds)
+
+
 class MF_LogFile:
     """
     A ComfyUI node that writes timestamped log entries to a text file.
     """
 
+    def __init__(self):
+        # In-memory copy of the log content, kept in lockstep with the file
+        # so each append does not re-read the whole (unbounded) log.
+        self._cache = None
+        self._cache_path = None
+
     DESCRIPTION = "Appends text entries to a log file.\nOptional timestamp prefix for each entry."
 
     CATEGORY = "MF_PipoNodes/Logging"
@@ -59,22 +90,39 @@ class MF_LogFile:
             log_file_path = _get_log_file_path(
                 save_log_path, log_file_name, folder_paths.get_output_directory()
             )
-            os.makedirs(os.path.dirname(log_file_path), exist_ok=True)
+            _ensure_dir(os.path.dirname(log_file_path))
 
             # Format entry with or without timestamp
             if enable_timestamp:
-                timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                # isoformat is a single C call and yields the same
+                # "YYYY-MM-DD HH:MM:SS" layout without walking a format string
+                timestamp = datetime.datetime.now().isoformat(sep=" ", timespec="seconds")
                 formatted_entry = f"[{timestamp}] {log_entry}\n\n"
             else:
                 formatted_entry = f"{log_entry}\n\n"
 
-            # Write new entry (append mode to preserve log history)
-            with open(log_file_path, "a", encoding="utf-8") as f:
-                f.write(formatted_entry)
+            # Write new entry (O_APPEND to preserve log history; fd reused
+            # across calls and instances for the same path, and skips
+            # rebuilding the whole io stack (TextIOWrapper etc.) per entry)
+            fd = _log_fds.get(log_file_path)
+            if fd is None:
+                fd = os.open(log_file_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+                _log_fds[log_file_path] = fd
+            os.write(fd, formatted_entry.encode("utf-8"))
+
+            # Update the cached content instead of re-reading the whole file;
+            # only load from disk once per path
+            if self._cache is None or self._cache_path != log_file_path:
+                with open(log_file_path, "r", encoding="utf-8") as f:
+                    self._cache = f.read()
+                self._cache_path = log_file_path
+            else:
+                self._cache += formatted_entry
 
-            # Read entire log for display
-            with open(log_file_path, "r", encoding="utf-8") as f:
-                log_content = f.read()
+            if len(self._cache) > _LOG_CACHE_MAX_CHARS:
+                self._cache = self._cache[-_LOG_CACHE_MAX_CHARS:]
+
+            log_content = self._cache
 
             print(f"📝 [MF_LogFile] Wrote entry to {log_file_path}")
 
@@ -105,6 +153,11 @@ class MF_LogReader:
 
     CATEGORY = "MF_PipoNodes/Logging"
 
+    def __init__(self):
+        # path -> (st_mtime_ns, st_size, content): skips re-reading the file
+        # on every refresh when it has not changed
+        self._cache = {}
+
     @classmethod
     def INPUT_TYPES(cls):
         return {
@@ -133,12 +186,19 @@ class MF_LogReader:
 
         try:
             if os.path.exists(full_path):
-                with open(full_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-
-                print(
-                    f"📖 [MF_LogReader] Read {len(content)} characters from {os.path.basename(full_path)}"
-                )
+                st = os.stat(full_path)
+                cached = self._cache.get(full_path)
+                if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                    # File unchanged since last read — reuse cached content
+                    content = cached[2]
+                else:
+                    with open(full_path, "r", encoding="utf-8") as f:
+                        content = f.read()
+                    self._cache[full_path] = (st.st_mtime_ns, st.st_size, content)
+
+                    print(
+                        f"📖 [MF_LogReader] Read {len(content)} characters from {os.path.basename(full_path)}"
+                    )
 
                 return {
                     "ui": {
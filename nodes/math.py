@@ -1,5 +1,7 @@
 """MF PipoNodes — Math operation nodes."""
 
+from ._common import DEBUG as _DEBUG
+
 
 class MF_ModuloAdvanced:
     """
@@ -43,14 +45,17 @@ class MF_ModuloAdvanced:
 
     def apply_modulo_advanced(self, input_number, modulo_value):
         """Apply modulo operation and compute cycle count (stateless)."""
-        modulo_result = input_number % modulo_value
-        cycle_count = input_number // modulo_value
+        # divmod yields quotient and remainder in one operation
+        cycle_count, modulo_result = divmod(input_number, modulo_value)
+        modulo_str = str(modulo_result)
+        cycle_str = str(cycle_count)
 
-        text_output = f"🔢 {input_number} mod {modulo_value} = {modulo_result}\n🔄 Cycle: {cycle_count}"
+        text_output = f"🔢 {input_number} mod {modulo_value} = {modulo_str}\n🔄 Cycle: {cycle_str}"
 
-        print(
-            f"[MF_Modulo] {input_number} mod {modulo_value} = {modulo_result}, Cycle: {cycle_count}"
-        )
+        if _DEBUG:
+            print(
+                f"[MF_Modulo] {input_number} mod {modulo_value} = {modulo_str}, Cycle: {cycle_str}"
+            )
 
         return {
             "ui": {
@@ -58,9 +63,9 @@ class MF_ModuloAdvanced:
             },
             "result": (
                 modulo_result,
-                str(modulo_result),
+                modulo_str,
                 cycle_count,
-                str(cycle_count),
+                cycle_str,
             ),
         }
 
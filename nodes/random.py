@@ -17,6 +17,13 @@ class MF_DiceRoller:
 
     CATEGORY = "MF_PipoNodes/Random"
 
+    # Face counts for the standard dice (avoids parsing "D20" on every roll)
+    _FACES = {"D4": 4, "D6": 6, "D8": 8, "D10": 10, "D12": 12, "D20": 20, "D100": 100}
+
+    def __init__(self):
+        # Dedicated RNG instance; skips the lock on the shared module-level one
+        self._rng = random.Random()
+
     @classmethod
     def INPUT_TYPES(cls):
         return {
@@ -51,11 +58,8 @@ class MF_DiceRoller:
 
     def roll_dice(self, dice, custom_faces=6):
         """Roll the specified dice and return the result."""
-        if dice == "DCustom":
-            max_value = custom_faces
-        else:
-            max_value = int(dice[1:])
-        result = random.randint(1, max_value)
+        max_value = custom_faces if dice == "DCustom" else self._FACES[dice]
+        result = self._rng.randint(1, max_value)
 
         dice_label = f"D{max_value}" if dice == "DCustom" else dice
         print(f"🎲 Rolled {dice_label}: {result}")
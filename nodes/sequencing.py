@@ -1,9 +1,47 @@
 """MF PipoNodes — Sequencing nodes (Shot Helper, Story Driver)."""
 
+import bisect
 import random
+import re
+import sys
+from collections import defaultdict
+from functools import lru_cache
+
+from ._common import DEBUG as _DEBUG
 
 # Simple in-memory step counter. No files. Resets on ComfyUI restart.
-_steps = {}
+_steps = defaultdict(int)
+
+# Integer tokens in a beats string; handles comma/newline separators and
+# array brackets in one pass, no per-token stripping
+_BEAT_RE = re.compile(r"-?\d+")
+
+
+@lru_cache(maxsize=32)
+def _parse_beats(beats):
+    """Parse a beats string into a sorted tuple of ints.
+
+    A single regex scan extracts the integer tokens, subsuming bracket
+    stripping, newline handling and per-token whitespace. Cached: the beats
+    input is typically identical across many steps, so after the first call
+    the parse collapses to a dict lookup. The tuple is immutable (safe to
+    share) and works directly with bisect.
+    """
+    return tuple(sorted(map(int, _BEAT_RE.findall(beats))))
+
+
+@lru_cache(maxsize=4096)
+def _shot_strings(seq, shot):
+    """(seq_str, shot_str, shot_name) for a sequence/shot pair — cached.
+
+    Pure function of two small ints that repeat constantly across a session;
+    a cache hit is one dict lookup. Each int is converted to a string once,
+    and zfill pads the same digit strings for the name instead of re-running
+    the :02d format machinery.
+    """
+    seq_str = str(seq)
+    shot_str = str(shot)
+    return seq_str, shot_str, f"seq{seq_str.zfill(2)}_shot{shot_str.zfill(2)}"
 
 
 class MF_ShotHelper:
@@ -51,48 +89,24 @@ class MF_ShotHelper:
             tuple: (sequence_int, sequence_str, shot_int, shot_str, shot_name)
                    shot_name format: "seq01_shot01"
         """
-        # Parse beats string into sorted list of integers
-        beat_list = []
-        if beats.strip():
-            try:
-                # Remove array brackets if present
-                beats_clean = beats.strip()
-                if beats_clean.startswith("[") and beats_clean.endswith("]"):
-                    beats_clean = beats_clean[1:-1]
-
-                # Replace newlines with commas for unified parsing
-                beats_clean = beats_clean.replace("\n", ",")
-
-                # Split by comma and parse integers
-                beat_list = sorted(
-                    [int(b.strip()) for b in beats_clean.split(",") if b.strip()]
-                )
-            except ValueError:
-                print(
-                    f"⚠️ [MF_ShotHelper] Invalid beats format '{beats}'. Using empty beats."
-                )
-                beat_list = []
-
-        # Determine which sequence we're in
-        sequence_num = 1
-        shot_start = 0
-
-        for beat in beat_list:
-            if step >= beat:
-                sequence_num += 1
-                shot_start = beat
-            else:
-                break
+        # Parse beats string into a sorted tuple of integers (cached per
+        # string). Empty beats is the common default — skip even the cache.
+        beat_list = _parse_beats(beats) if beats else ()
+
+        # Determine which sequence we're in: count beats at or before the
+        # current step with a C-level binary search instead of a linear scan
+        idx = bisect.bisect_right(beat_list, step)
+        sequence_num = idx + 1
+        shot_start = beat_list[idx - 1] if idx else 0
 
         # Calculate shot number within the current sequence
         shot_num = step - shot_start + 1
 
         # Generate formatted outputs
-        sequence_str = str(sequence_num)
-        shot_str = str(shot_num)
-        shot_name = f"seq{sequence_num:02d}_shot{shot_num:02d}"
+        sequence_str, shot_str, shot_name = _shot_strings(sequence_num, shot_num)
 
-        print(f"🎬 [MF_StorySequence] Step {step}: {shot_name}")
+        if _DEBUG:
+            print(f"🎬 [MF_StorySequence] Step {step}: {shot_name}")
 
         return (sequence_num, sequence_str, shot_num, shot_str, shot_name)
 
@@ -141,18 +155,23 @@ class MF_StoryDriver:
 
     def execute(self, projectName, storySeed, randomize_seed_on_reset, unique_id=None):
         """Execute: read step, return it, increment for next time."""
-        # Get current step (starts at 0)
-        current_step = _steps.get(projectName, 0)
+        # Interned key: the _steps lookups below resolve by pointer identity
+        # instead of a character-by-character compare
+        projectName = sys.intern(projectName)
 
-        # Store incremented value for next execution
+        # Get current step (starts at 0) and store the incremented value
+        # for next execution
+        current_step = _steps[projectName]
         _steps[projectName] = current_step + 1
 
-        # Prepare outputs
+        # Prepare outputs (convert each int to string once and reuse)
+        step_str = str(current_step)
         project_name_output = projectName.replace(" ", "_")
         save_folder = f"{project_name_output}_{storySeed}"
-        status_text = f"Step: {current_step} | Seed: {storySeed}"
+        status_text = f"Step: {step_str} | Seed: {storySeed}"
 
-        print(f"🎬 [MF_StoryDriver] {projectName}: Step {current_step}, Seed {storySeed}")
+        if _DEBUG:
+            print(f"🎬 [MF_StoryDriver] {projectName}: Step {current_step}, Seed {storySeed}")
 
         return {
             "ui": {
@@ -160,7 +179,7 @@ class MF_StoryDriver:
             },
             "result": (
                 current_step,
-                str(current_step),
+                step_str,
                 project_name_output,
                 save_folder,
                 storySeed,
@@ -170,7 +189,7 @@ class MF_StoryDriver:
     @classmethod
     def reset_project(cls, project_name):
         """Reset step to 0. That's it."""
-        _steps[project_name] = 0
+        _steps[sys.intern(project_name)] = 0
         print(f"🔄 [MF_StoryDriver] Reset '{project_name}' → step=0")
 
 
@@ -1,9 +1,16 @@
 """MF PipoNodes — Text processing nodes."""
 
+import io
+import itertools
+
 
 def _normalize_text_lines(text):
-    """Normalize line endings and split text into lines."""
-    return text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    """Split text into lines, handling \\r\\n, \\r and \\n terminators.
+
+    splitlines does the normalization in a single C pass, with no
+    intermediate string allocations.
+    """
+    return text.splitlines()
 
 
 class MF_LineCounter:
@@ -36,8 +43,10 @@ class MF_LineCounter:
         if not text.strip():
             return (0, "0")
 
-        lines = _normalize_text_lines(text)
-        line_count = len(lines)
+        # Count terminators directly instead of materializing a line list;
+        # \r\n, \r and \n are all covered by the three C-level counts
+        breaks = text.count("\n") + text.count("\r") - text.count("\r\n")
+        line_count = breaks + (0 if text.endswith(("\n", "\r")) else 1)
 
         return (line_count, str(line_count))
 
@@ -67,14 +76,34 @@ class MF_LineSelect:
 
     def select_line(self, text, line_index):
         """Select a specific line from the input text based on index."""
-        lines = _normalize_text_lines(text)
-
-        if line_index < 0 or line_index >= len(lines):
-            error_msg = f"⚠️ Line index {line_index} out of range (0-{len(lines) - 1})"
+        if not text:
+            # splitlines sees no lines in an empty string, but index 0 has
+            # always selected the (empty) first line here
+            if line_index == 0:
+                return ("",)
+            error_msg = f"⚠️ Line index {line_index} out of range (text is empty)"
             print(f"[MF_LineSelect] {error_msg}")
             return (error_msg,)
 
-        return (lines[line_index],)
+        if line_index >= 0 and "\r" not in text:
+            # Common case: plain \n text. Walk lazily to the requested line
+            # instead of materializing every line — for a small index into a
+            # large text this stops as soon as the line is reached.
+            line = next(
+                itertools.islice(io.StringIO(text), line_index, line_index + 1), None
+            )
+            if line is not None:
+                return (line.rstrip("\n"),)
+        else:
+            lines = _normalize_text_lines(text)
+            if 0 <= line_index < len(lines):
+                return (lines[line_index],)
+
+        # Out of range — only now pay for the full line count
+        line_count = len(_normalize_text_lines(text))
+        error_msg = f"⚠️ Line index {line_index} out of range (0-{line_count - 1})"
+        print(f"[MF_LineSelect] {error_msg}")
+        return (error_msg,)
 
 
 NODE_CLASS_MAPPINGS = {
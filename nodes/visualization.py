@@ -2,32 +2,105 @@
 
 import os
 import json
+import atexit
+import threading
+from array import array
+
+from ._common import DEBUG as _DEBUG
+
+# Optional C-accelerated JSON, as in nodes/data.py
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # State files live in the package root (one level up from nodes/)
 _PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 _GRAPH_STATE_FILE = os.path.join(_PACKAGE_ROOT, "graph_plotter_state.json")
+# Pre-encoded for open(): skips the internal fsencode of the str path per call
+_GRAPH_STATE_FILE_BYTES = os.fsencode(_GRAPH_STATE_FILE)
+
+# The state lives in memory and is flushed to disk at most once per
+# _FLUSH_DELAY_S while dirty, instead of a full read + re-serialize + write
+# of the entire history on every plotted point
+_state_cache = None
+_state_dirty = False
+_flush_timer = None
+_FLUSH_DELAY_S = 0.5
+
+# Guards the read-modify-write on the state: concurrent plotter nodes (and
+# the reset route, which runs on a worker thread) must not interleave their
+# updates or race the flush timer. Entry points lock; the helpers below
+# assume the caller holds it.
+_state_lock = threading.Lock()
 
 
 def _read_graph_state():
-    """Read graph plotter state from file. Returns dict."""
-    if os.path.exists(_GRAPH_STATE_FILE):
+    """Return the graph plotter state dict, loading it from file on first use."""
+    global _state_cache
+    if _state_cache is None:
+        _state_cache = {}
+        # EAFP: just open — avoids the os.path.exists stat syscall and its
+        # check-then-open race
         try:
-            with open(_GRAPH_STATE_FILE, "r") as f:
-                return json.load(f)
+            with open(_GRAPH_STATE_FILE_BYTES, "rb") as f:
+                raw = f.read()
+            _state_cache = orjson.loads(raw) if orjson else json.loads(raw)
+            # Hold the series as typed int arrays: 4 bytes per point and
+            # C-level appends, instead of a list of boxed ints. X is
+            # implied by position (see plot_graph), so drop any x_data
+            # still present in files written by older versions.
+            for node_data in _state_cache.values():
+                node_data.pop("x_data", None)
+                node_data["y_data"] = array("i", node_data.get("y_data", ()))
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"⚠️ [MF_GraphPlotter] Could not read state: {e}")
-    return {}
+            _state_cache = {}
+    return _state_cache
 
 
-def _write_graph_state(state):
-    """Write graph plotter state to file."""
+def _flush_graph_state():
+    """Write the cached state to file if it has unsaved changes."""
+    with _state_lock:
+        _flush_graph_state_locked()
+
+
+def _flush_graph_state_locked():
+    global _state_dirty, _flush_timer
+    _flush_timer = None
+    if not _state_dirty or _state_cache is None:
+        return
+    _state_dirty = False
     try:
-        with open(_GRAPH_STATE_FILE, "w") as f:
-            json.dump(state, f, indent=2)
+        # Compact output: machine-only state. default=list unpacks the
+        # typed arrays for either serializer.
+        if orjson:
+            payload = orjson.dumps(_state_cache, default=list)
+        else:
+            payload = json.dumps(_state_cache, separators=(",", ":"), default=list).encode("utf-8")
+        with open(_GRAPH_STATE_FILE_BYTES, "wb") as f:
+            f.write(payload)
     except Exception as e:
         print(f"❌ [MF_GraphPlotter] Error writing state: {e}")
 
 
+def _write_graph_state(state):
+    """Adopt the given state dict and schedule a coalesced write to disk."""
+    global _state_cache, _state_dirty, _flush_timer
+    _state_cache = state
+    _state_dirty = True
+    if _flush_timer is None:
+        _flush_timer = threading.Timer(_FLUSH_DELAY_S, _flush_graph_state)
+        _flush_timer.daemon = True
+        _flush_timer.start()
+
+
+# Make sure a pending debounced write is not lost on shutdown
+atexit.register(_flush_graph_state)
+
+
 class MF_GraphPlotter:
     """
     A ComfyUI node that plots X,Y integer data points on a graph.
@@ -71,35 +144,40 @@ class MF_GraphPlotter:
         Add data point and update graph. X auto-increments per execution.
         Always reads fresh state from disk.
         """
-        # Read current state from file
-        state = _read_graph_state()
-
-        # Get or create node entry
         node_id = str(unique_id) if unique_id else "default"
-        if node_id not in state:
-            state[node_id] = {"x_data": [], "y_data": []}
 
-        node_data = state[node_id]
+        with _state_lock:
+            # Read current state (cached after first load)
+            state = _read_graph_state()
+
+            # Get or create node entry
+            if node_id not in state:
+                state[node_id] = {"y_data": array("i")}
 
-        # Auto-increment X (step number = current point count + 1)
-        X = len(node_data["x_data"]) + 1
+            y_data = state[node_id]["y_data"]
 
-        # Add new data point
-        node_data["x_data"].append(X)
-        node_data["y_data"].append(Y)
+            # X is fully determined by position: point i has X = i + 1.
+            # Storing it would double the state size for no information.
+            X = len(y_data) + 1
 
-        # Write updated state back to file
-        _write_graph_state(state)
+            # Add new data point
+            y_data.append(Y)
 
-        # Prepare data for frontend
+            # Schedule the updated state for write-back
+            _write_graph_state(state)
+
+        # Send only the new point — O(1) payload instead of re-shipping the
+        # full series each step. The frontend accumulates, and hydrates the
+        # whole history from /graph_plotter/history when it is out of sync.
         graph_data = {
-            "x_values": node_data["x_data"],
-            "y_values": node_data["y_data"],
+            "new_x": X,
+            "new_y": Y,
             "node_id": node_id,
-            "point_count": len(node_data["x_data"]),
+            "point_count": X,
         }
 
-        print(f"📊 [MF_GraphPlotter] Step {X}: Y={Y}")
+        if _DEBUG:
+            print(f"📊 [MF_GraphPlotter] Step {X}: Y={Y}")
 
         return {
             "ui": {
@@ -108,14 +186,30 @@ class MF_GraphPlotter:
             "result": (),
         }
 
+    @classmethod
+    def get_node_history(cls, node_id):
+        """Full series for a node. Serves the /graph_plotter/history route."""
+        with _state_lock:
+            node_data = _read_graph_state().get(node_id)
+            y_values = list(node_data["y_data"]) if node_data else []
+        return {
+            "node_id": node_id,
+            "x_values": list(range(1, len(y_values) + 1)),
+            "y_values": y_values,
+            "point_count": len(y_values),
+        }
+
     @classmethod
     def reset_node_data(cls, node_id):
         """Reset graph data for a specific node. Uses same file functions as plot_graph."""
-        state = _read_graph_state()
-
-        state[node_id] = {"x_data": [], "y_data": []}
-
-        _write_graph_state(state)
+        with _state_lock:
+            state = _read_graph_state()
+            # Drop the entry outright instead of writing back an empty
+            # placeholder; plot_graph recreates it on the next point and the
+            # coalesced flush persists the deletion — no immediate
+            # re-serialization of every other node's history
+            state.pop(node_id, None)
+            _write_graph_state(state)
         print(f"🔄 [MF_GraphPlotter] Reset node {node_id} (file: {_GRAPH_STATE_FILE})")
 
 
@@ -3,32 +3,55 @@ MF PipoNodes - Server Endpoints
 API routes for Graph Plotter and Story Driver reset buttons
 """
 
+import asyncio
+import json
+
 from aiohttp import web
 import server
 
 from ..nodes import MF_GraphPlotter, MF_StoryDriver
 
+# Optional C-accelerated JSON, as in the node modules
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_response(payload, status=200):
+    """JSON response encoded with orjson when available."""
+    body = orjson.dumps(payload) if orjson else json.dumps(payload).encode("utf-8")
+    return web.Response(body=body, status=status, content_type="application/json")
+
 
 @server.PromptServer.instance.routes.post("/graph_plotter/reset")
 async def reset_graph_plotter(request):
     """Reset a Graph Plotter node's data."""
     try:
         data = await request.json()
-        node_id = data.get("node_id")
+    except ValueError:
+        return _json_response({"success": False, "error": "invalid JSON body"}, status=400)
+
+    node_id = data.get("node_id")
+    if not node_id:
+        return _json_response({"success": False, "error": "node_id is required"}, status=400)
+
+    # reset touches the state file — keep the blocking I/O off the event loop
+    await asyncio.to_thread(MF_GraphPlotter.reset_node_data, node_id)
+
+    return _json_response({"success": True, "node_id": node_id, "message": "Graph data reset"})
 
-        if not node_id:
-            return web.json_response(
-                {"success": False, "error": "node_id is required"}, status=400
-            )
 
-        MF_GraphPlotter.reset_node_data(node_id)
+@server.PromptServer.instance.routes.get("/graph_plotter/history")
+async def graph_plotter_history(request):
+    """Full point history for one Graph Plotter node (frontend hydration)."""
+    node_id = request.query.get("node_id")
+    if not node_id:
+        return _json_response({"success": False, "error": "node_id is required"}, status=400)
 
-        return web.json_response(
-            {"success": True, "node_id": node_id, "message": "Graph data reset"}
-        )
+    history = await asyncio.to_thread(MF_GraphPlotter.get_node_history, node_id)
 
-    except Exception as e:
-        return web.json_response({"success": False, "error": str(e)}, status=500)
+    return _json_response({"success": True, **history})
 
 
 @server.PromptServer.instance.routes.post("/story_driver/reset")
@@ -36,13 +59,11 @@ async def reset_story_driver(request):
     """Reset a Story Driver step counter to 0."""
     try:
         data = await request.json()
-        project_name = data.get("project_name", "MyProject")
+    except ValueError:
+        return _json_response({"success": False, "error": "invalid JSON body"}, status=400)
 
-        MF_StoryDriver.reset_project(project_name)
+    project_name = data.get("project_name", "MyProject")
 
-        return web.json_response(
-            {"success": True, "project_name": project_name, "step": 0}
-        )
+    await asyncio.to_thread(MF_StoryDriver.reset_project, project_name)
 
-    except Exception as e:
-        return web.json_response({"success": False, "error": str(e)}, status=500)
+    return _json_response({"success": True, "project_name": project_name, "step": 0})
@@ -495,6 +495,42 @@ app.registerExtension({
         }
       }
 
+      // Append a single point without rebuilding the whole series
+      nodeType.prototype.appendChartPoint = function (x, y) {
+        if (!this.chart) {
+          console.warn('⚠️ Chart not initialized')
+          return
+        }
+
+        try {
+          this.chart.data.labels.push(x)
+          this.chart.data.datasets[0].data.push(y)
+          this.chart.update()
+          this._syncChartSize?.()
+        } catch (error) {
+          console.error('Error appending chart point:', error)
+        }
+      }
+
+      // Fetch the full series from the backend (after page load or reset)
+      nodeType.prototype.hydrateChart = async function (nodeId) {
+        try {
+          const response = await api.fetchApi(
+            `/graph_plotter/history?node_id=${encodeURIComponent(nodeId)}`
+          )
+          if (response.ok) {
+            const data = await response.json()
+            if (this && this.chart && !this._isBeingRemoved) {
+              this.updateChart(data.x_values, data.y_values)
+            }
+          } else {
+            console.error('Failed to fetch graph history:', await response.text())
+          }
+        } catch (error) {
+          console.error('Error hydrating chart:', error)
+        }
+      }
+
       // Save graph with file dialog
       nodeType.prototype.saveGraphWithDialog = async function () {
         if (!this.chart || !this.graphCanvas) {
@@ -629,7 +665,13 @@ app.registerExtension({
 
           // Update chart - but check if still valid
           if (this && this.chart && !this._isBeingRemoved) {
-            this.updateChart(data.x_values, data.y_values)
+            // Incremental payload: append the new point when the chart is in
+            // sync with the backend, otherwise hydrate the full series once
+            if (this.chart.data.labels.length === data.point_count - 1) {
+              this.appendChartPoint(data.new_x, data.new_y)
+            } else {
+              this.hydrateChart(data.node_id)
+            }
             console.log(`📊 Graph updated: ${data.point_count} points`)
           }
         }